@@ -1,26 +1,67 @@
 """Copy and paste extension: Ctrl+C to copy selected text, Ctrl+V to paste.
 
-Uses the Linux system clipboard via xclip.
+Uses the Linux system clipboard via xsel or xclip. Without an X display (or
+without either tool installed), copy and paste still work, but only within
+the editor.
 Requires the 'selection' extension to be installed for copy to work.
 """
 
-import subprocess
+import os
+import shutil
+import signal
 
 # Key codes for Ctrl+C and Ctrl+V
 KEY_COPY = 3
 KEY_PASTE = 22
 
+# Every key this extension handles; anything else returns immediately
+_KEYS = frozenset({KEY_COPY, KEY_PASTE})
 
-def _get_sorted_range(anchor, cursor):
-    """Return (start_row, start_col, end_row, end_col) with start <= end."""
-    if anchor <= cursor:
-        return anchor[0], anchor[1], cursor[0], cursor[1]
-    return cursor[0], cursor[1], anchor[0], anchor[1]
+# Signals Python ignores at startup, reset to their defaults in the clipboard
+# tool like subprocess's restore_signals does (xsel/xclip may keep running in
+# the background to serve the selection)
+_CHILD_DEFAULT_SIGNALS = (signal.SIGPIPE, signal.SIGXFSZ)
+
+# Clipboard commands, resolved once in setup() so each copy/paste does not
+# search PATH again. None means the system clipboard is unavailable.
+_copy_cmd = None
+_paste_cmd = None
+
+# Clipboard text is encoded and piped in pieces of this many characters/bytes,
+# so copying a large buffer never holds a second full-size copy as bytes
+_CHUNK_SIZE = 65536
+
+# Editor-local clipboard used when the system clipboard is unavailable
+_local_clipboard = ""
+
+
+def _get_lines(payload):
+    """Return the buffer lines, fetched at most once per event dispatch.
+
+    The list is cached on the payload so later hooks for the same event can
+    reuse it. Treat it as read-only.
+    """
+    lines = payload.get("lines")
+    if lines is None:
+        lines = payload["lines"] = payload["api"].get_lines()
+    return lines
+
+
+def _get_cursor(payload):
+    """Return the cursor (row, col), fetched at most once per event dispatch."""
+    cursor = payload.get("cursor")
+    if cursor is None:
+        cursor = payload["cursor"] = payload["api"].get_cursor()
+    return cursor
 
 
 def _extract_selected_text(lines, anchor, cursor):
     """Extract the text between anchor and cursor from the buffer lines."""
-    sr, sc, er, ec = _get_sorted_range(anchor, cursor)
+    # Order the endpoints so (sr, sc) comes first
+    if anchor <= cursor:
+        (sr, sc), (er, ec) = anchor, cursor
+    else:
+        (sr, sc), (er, ec) = cursor, anchor
 
     # Single-line selection
     if sr == er:
@@ -35,29 +76,95 @@ def _extract_selected_text(lines, anchor, cursor):
     return "\n".join(parts)
 
 
+def _find_clipboard_commands():
+    """Return (copy_cmd, paste_cmd) for xsel or xclip, or (None, None)."""
+    # xsel starts faster than xclip, so prefer it when both are installed
+    xsel = shutil.which("xsel")
+    if xsel:
+        return [xsel, "--clipboard", "--input"], [xsel, "--clipboard", "--output"]
+    xclip = shutil.which("xclip")
+    if xclip:
+        return [xclip, "-selection", "clipboard"], [xclip, "-selection", "clipboard", "-o"]
+    return None, None
+
+
+def _write_all(fd, data):
+    """Write all of data to fd, retrying after partial writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 def _copy_to_clipboard(text):
-    """Send text to the system clipboard using xclip."""
-    subprocess.run(
-        ["xclip", "-selection", "clipboard"],
-        input=text.encode(),
-        check=False,
-    )
+    """Send text to the system clipboard."""
+    global _local_clipboard
+    if _copy_cmd is None:
+        _local_clipboard = text
+        return
+
+    # posix_spawn avoids subprocess's fork bookkeeping for this short-lived child
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(_copy_cmd[0], _copy_cmd, os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, read_fd, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ], setsigdef=_CHILD_DEFAULT_SIGNALS)
+    except OSError:
+        os.close(write_fd)
+        return
+    finally:
+        os.close(read_fd)
+
+    try:
+        for start in range(0, len(text), _CHUNK_SIZE):
+            _write_all(write_fd, text[start:start + _CHUNK_SIZE].encode())
+    except OSError:
+        pass  # The tool exited early; nothing more to send
+    finally:
+        os.close(write_fd)
+    os.waitpid(pid, 0)
 
 
 def _read_from_clipboard():
-    """Read text from the system clipboard using xclip."""
-    result = subprocess.run(
-        ["xclip", "-selection", "clipboard", "-o"],
-        capture_output=True,
-        check=False,
-    )
-    return result.stdout.decode()
+    """Read text from the system clipboard."""
+    if _paste_cmd is None:
+        return _local_clipboard
+
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(_paste_cmd[0], _paste_cmd, os.environ, file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_DUP2, write_fd, 1),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ], setsigdef=_CHILD_DEFAULT_SIGNALS)
+    except OSError:
+        os.close(read_fd)
+        return ""
+    finally:
+        os.close(write_fd)
+
+    data = bytearray()
+    try:
+        while True:
+            chunk = os.read(read_fd, _CHUNK_SIZE)
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(read_fd)
+    os.waitpid(pid, 0)
+    return data.decode("utf-8", "replace")
 
 
 def _on_key(event, payload):
     """Handle Ctrl+C (copy) and Ctrl+V (paste)."""
-    api = payload["api"]
     key = payload.get("key")
+    if key not in _KEYS:
+        return False
+
+    api = payload["api"]
 
     if key == KEY_COPY:
         # Read the selection anchor set by the selection extension
@@ -65,11 +172,11 @@ def _on_key(event, payload):
         if anchor is None:
             return False
 
-        cursor = api.get_cursor()
+        cursor = _get_cursor(payload)
         if anchor == cursor:
             return False
 
-        lines = api.get_lines()
+        lines = _get_lines(payload)
         text = _extract_selected_text(lines, anchor, cursor)
         _copy_to_clipboard(text)
         return True
@@ -79,46 +186,52 @@ def _on_key(event, payload):
         if not text:
             return True
 
+        # Fetch a fresh copy: it is modified in place below
         lines = api.get_lines()
-        row, col = api.get_cursor()
+        row, col = _get_cursor(payload)
         current_line = lines[row]
 
         # Split the current line at the cursor position
         before = current_line[:col]
         after = current_line[col:]
 
+        # Fast path: single-line paste only rewrites the current line
+        if "\n" not in text:
+            lines[row] = before + text + after
+            api.replace_lines(lines)
+            api.set_cursor(row, col + len(text))
+            payload.pop("lines", None)
+            payload.pop("cursor", None)
+            return True
+
         # Split pasted text into lines
         pasted_lines = text.split("\n")
 
-        # Build the new lines:
+        # Build the replacement for the current line:
         # - First pasted line joins with text before cursor
         # - Last pasted line joins with text after cursor
         # - Middle pasted lines go in between
-        new_lines = lines[:row]
-        new_lines.append(before + pasted_lines[0])
-
-        for pasted_line in pasted_lines[1:]:
-            new_lines.append(pasted_line)
+        segment = [before + pasted_lines[0]]
+        segment.extend(pasted_lines[1:-1])
+        segment.append(pasted_lines[-1] + after)
 
-        # Join the last pasted line with the text after the cursor
-        new_lines[-1] = new_lines[-1] + after
+        # Splice it in place of the current line instead of copying the buffer
+        lines[row:row + 1] = segment
 
-        # Add the remaining original lines
-        new_lines.extend(lines[row + 1:])
-
-        api.replace_lines(new_lines)
+        api.replace_lines(lines)
 
         # Move cursor to end of pasted text
         end_row = row + len(pasted_lines) - 1
         end_col = len(pasted_lines[-1])
-        if len(pasted_lines) == 1:
-            end_col += col  # Same line, offset by original position
         api.set_cursor(end_row, end_col)
+        payload.pop("lines", None)
+        payload.pop("cursor", None)
 
         return True
 
-    return False
-
 
 def setup(register_hook):
+    global _copy_cmd, _paste_cmd
+    if os.environ.get("DISPLAY"):
+        _copy_cmd, _paste_cmd = _find_clipboard_commands()
     register_hook(2, _on_key, event="key")
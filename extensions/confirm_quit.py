@@ -16,15 +16,17 @@ def _ask_quit(api):
     else:
         y, x, w = height - 1, 0, width
 
-    while True:
-        try:
-            win.move(y, x)
-            win.clrtoeol()
-            win.addnstr(y, x, PROMPT[: w - 1], w - 1)
-            win.refresh()
-        except curses.error:
-            pass
+    # The prompt never changes, so draw it once rather than after every key
+    try:
+        win.move(y, x)
+        win.clrtoeol()
+        win.addnstr(y, x, PROMPT[: w - 1], w - 1)
+        win.noutrefresh()
+        curses.doupdate()
+    except curses.error:
+        pass
 
+    while True:
         key = win.getch()
         if key in (ord("y"), ord("Y")):
             return True
@@ -13,7 +13,30 @@ _ENABLE = b"\x1b[>4;2m"  # turn extended key reporting on
 _DISABLE = b"\x1b[>4;0m"  # restore normal key reporting
 
 
-def _parse_csi_u(seq):
+# Modifier name prefixes indexed by the 3-bit (ctrl, alt, shift) pattern
+_MOD_NAMES = (
+    "",
+    "shift_",
+    "alt_",
+    "alt_shift_",
+    "ctrl_",
+    "ctrl_shift_",
+    "ctrl_alt_",
+    "ctrl_alt_shift_",
+)
+
+# Lowercased names for ASCII codepoints, so common keys need no chr() call
+_ASCII_NAMES = tuple(chr(c).lower() for c in range(128))
+
+_LBRACKET = 0x5B  # "["
+_SEMICOLON = 0x3B  # ";"
+_LETTER_U = 0x75  # "u"
+
+# Longest escape sequence read after ESC; longer input is not a key sequence
+_MAX_SEQ_LEN = 32
+
+
+def _parse_csi_u(chars):
     """Parse a CSI u-sequence and return a key name string, or None.
 
     When modifyOtherKeys is active, the terminal encodes key presses as:
@@ -24,40 +47,43 @@ def _parse_csi_u(seq):
     encodes which modifier keys were held (1 = none, 2 = Shift, 5 = Ctrl,
     6 = Ctrl+Shift, etc.).
 
-    This function converts that into a readable name like "ctrl_shift_z".
+    chars is the list of character codes read after the ESC, e.g. the codes
+    for "[122;6u". This converts that into a readable name like "ctrl_shift_z".
     """
-    # seq is everything after the ESC, e.g. "[122;6u"
-    if not (seq.startswith("[") and seq.endswith("u") and ";" in seq):
+    n = len(chars)
+    if n < 5 or chars[0] != _LBRACKET or chars[-1] != _LETTER_U:
         return None
 
-    inner = seq[1:-1]  # strip the leading "[" and trailing "u"
-    parts = inner.split(";")
-    if len(parts) != 2:
+    # Scan the codepoint digits
+    i = 1
+    codepoint = 0
+    while i < n and 48 <= chars[i] <= 57:
+        codepoint = codepoint * 10 + (chars[i] - 48)
+        i += 1
+    if i == 1 or chars[i] != _SEMICOLON:
         return None
 
-    try:
-        codepoint = int(parts[0])
-        modifier = int(parts[1])
-    except ValueError:
+    # Scan the modifier digits, which must run up to the trailing "u"
+    i += 1
+    start = i
+    modifier = 0
+    while i < n and 48 <= chars[i] <= 57:
+        modifier = modifier * 10 + (chars[i] - 48)
+        i += 1
+    if i == start or i != n - 1:
         return None
 
-    # The modifier value is 1 + (shift bit) + (alt bit × 2) + (ctrl bit × 4)
-    bits = modifier - 1
-    mods = []
-    if bits & 4:
-        mods.append("ctrl")
-    if bits & 2:
-        mods.append("alt")
-    if bits & 1:
-        mods.append("shift")
-
-    try:
+    if codepoint < 128:
+        char = _ASCII_NAMES[codepoint]
+    elif codepoint <= 0x10FFFF:
         char = chr(codepoint).lower()
-    except (ValueError, OverflowError):
+    else:
         return None
 
-    # Build a name like "ctrl_shift_z" or just "z" if no modifiers were held
-    return "_".join(mods + [char]) if mods else char
+    # The modifier value is 1 + (shift bit) + (alt bit × 2) + (ctrl bit × 4).
+    # Build a name like "ctrl_shift_z", or just "z" if no modifiers were held.
+    bits = (modifier - 1) & 7
+    return _MOD_NAMES[bits] + char if bits else char
 
 
 def _on_init(event, payload):
@@ -82,22 +108,28 @@ def _on_key(event, payload):
     # single chunk, so if nothing is waiting immediately this is plain ESC.
     win.nodelay(True)
     chars = []
-    while True:
+    while len(chars) < _MAX_SEQ_LEN:
         ch = win.getch()
         if ch == -1:  # no more input right now
             break
         chars.append(ch)
+        # A CSI sequence ends at its final byte; stop there so keys typed
+        # right after it stay queued instead of being read and pushed back.
+        if chars[0] == _LBRACKET and len(chars) > 1 and 0x40 <= ch <= 0x7E:
+            break
     win.nodelay(False)
 
     if not chars:
         return False  # plain ESC key — do not consume it
 
-    seq  = "".join(chr(c) for c in chars)
-    name = _parse_csi_u(seq)
+    name = _parse_csi_u(chars)
 
     if name is None:
         # Not a recognised sequence — push the characters back so nothing
-        # is lost and other extensions still see them.
+        # is lost and other extensions still see them.  This goes through
+        # curses rather than a local queue: only curses' own input queue is
+        # read right after this ESC, in order, without waiting for another
+        # keypress.  The read loop above caps this at _MAX_SEQ_LEN codes.
         for ch in reversed(chars):
             curses.ungetch(ch)
         return False
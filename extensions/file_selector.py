@@ -5,6 +5,7 @@ Escape to cancel. Shows ".." to go to the parent directory.
 """
 
 import curses
+import os
 from pathlib import Path
 
 # Ctrl+O (ASCII 15) opens the file picker
@@ -32,19 +33,32 @@ def _build_entries(current_dir):
     if current_dir != current_dir.parent:
         entries.append(("..", current_dir.parent, True))
 
+    # Split into directories and files as (sort key, name) pairs. scandir's
+    # entries answer is_dir()/is_file() from the directory listing itself,
+    # so only symlinks need an extra stat call.
+    dirs = []
+    files = []
     try:
-        items = list(current_dir.iterdir())
+        with os.scandir(current_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        dirs.append((entry.name.lower(), entry.name))
+                    elif entry.is_file():
+                        files.append((entry.name.lower(), entry.name))
+                except OSError:
+                    continue
     except OSError:
         return entries
 
-    # Split into directories and files, sort each by name
-    dirs = sorted([p for p in items if p.is_dir()], key=lambda p: p.name.lower())
-    files = sorted([p for p in items if p.is_file()], key=lambda p: p.name.lower())
+    # Sort each by name
+    dirs.sort()
+    files.sort()
 
-    for p in dirs:
-        entries.append((p.name + "/", p, True))
-    for p in files:
-        entries.append((p.name, p, False))
+    for _, name in dirs:
+        entries.append((name + "/", current_dir / name, True))
+    for _, name in files:
+        entries.append((name, current_dir / name, False))
 
     return entries
 
@@ -59,19 +73,23 @@ def _run_picker(api):
 
     # Start in the directory of the current file (or cwd)
     current_dir = _get_current_dir(api)
-    entries = _build_entries(current_dir)
-    selected = 0 if entries else -1
+    entries = []
+    dir_changed = True
+    selected = 0
 
     # How many rows we can use for the list (leave a line for the hint)
     list_height = max(1, height - 1)
     scroll_y = 0  # First visible row in the list
+    drawn_view = None  # (dir, selected, scroll_y) currently on screen
 
     attr_normal = api.get_data("theme.ui", 0)
     attr_highlight = api.get_data("theme.ui_active", curses.A_REVERSE)
 
     while True:
-        # Keep entries in sync with current_dir
-        entries = _build_entries(current_dir)
+        # Re-list only after moving to another directory
+        if dir_changed:
+            entries = _build_entries(current_dir)
+            dir_changed = False
         if not entries:
             selected = -1
         else:
@@ -84,31 +102,40 @@ def _run_picker(api):
             if selected >= scroll_y + list_height:
                 scroll_y = selected - list_height + 1
 
-        # Draw the list
-        win.erase()
-        for i in range(list_height):
-            idx = scroll_y + i
-            if idx >= len(entries):
-                break
-            label, path, is_dir = entries[idx]
-            # Show one line per entry; trim if too long
-            display = label[: width - 1].ljust(width - 1) if width > 0 else ""
-            attr = attr_highlight if idx == selected else attr_normal
-            try:
-                win.addnstr(i, 0, display, width - 1, attr)
-            except curses.error:
-                pass
-
-        # Hint on the last line
-        hint = "Enter: open | Up/Down: move | Esc: cancel"
-        if width > 0 and height > 0:
-            hint_trim = hint[: width - 1]
-            try:
-                win.addnstr(height - 1, 0, hint_trim, width - 1, attr_normal)
-            except curses.error:
-                pass
-
-        win.refresh()
+        # Redraw only when the view changed; keys like Left/Right or an
+        # Enter on an empty list leave the screen as it is
+        view = (current_dir, selected, scroll_y)
+        if view != drawn_view:
+            drawn_view = view
+
+            # Draw the list
+            win.erase()
+            for i in range(list_height):
+                idx = scroll_y + i
+                if idx >= len(entries):
+                    break
+                label = entries[idx][0]
+                attr = attr_highlight if idx == selected else attr_normal
+                # Show one line per entry; addnstr trims it if too long, and
+                # chgat extends the row's style across the blank remainder
+                if width > 1:
+                    try:
+                        win.addnstr(i, 0, label, width - 1, attr)
+                        win.chgat(i, 0, width - 1, attr)
+                    except curses.error:
+                        pass
+
+            # Hint on the last line
+            hint = "Enter: open | Up/Down: move | Esc: cancel"
+            if width > 0 and height > 0:
+                hint_trim = hint[: width - 1]
+                try:
+                    win.addnstr(height - 1, 0, hint_trim, width - 1, attr_normal)
+                except curses.error:
+                    pass
+
+            win.noutrefresh()
+            curses.doupdate()
 
         key = win.getch()
 
@@ -124,6 +151,7 @@ def _run_picker(api):
                     current_dir = path
                 else:
                     current_dir = path
+                dir_changed = True
                 selected = 0
                 scroll_y = 0
             else:
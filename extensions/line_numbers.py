@@ -8,6 +8,53 @@ import curses
 # How many columns to reserve for the line number column (5 fits up to 99999)
 GUTTER_WIDTH = 5
 
+# Right-aligned line number strings per gutter width: _num_cache[lw][i] is the
+# label for buffer line i (0-based). Grown on demand up to _NUM_CACHE_MAX
+# entries, reused every frame; rows past the cap are formatted when drawn.
+_NUM_CACHE_MAX = 10000
+_num_cache: dict[int, list[str]] = {}
+
+
+def _get_lines(payload):
+    """Return the buffer lines, fetched at most once per event dispatch.
+
+    The list is cached on the payload so later hooks for the same event can
+    reuse it. Treat it as read-only.
+    """
+    lines = payload.get("lines")
+    if lines is None:
+        lines = payload["lines"] = payload["api"].get_lines()
+    return lines
+
+
+def _get_cursor(payload):
+    """Return the cursor (row, col), fetched at most once per event dispatch."""
+    cursor = payload.get("cursor")
+    if cursor is None:
+        cursor = payload["cursor"] = payload["api"].get_cursor()
+    return cursor
+
+
+def _format_num(line_num, lw):
+    """Return the 1-based line_num right-aligned in lw columns."""
+    # right-align: spaces on left for short numbers; 12345 fills all 5.
+    # Numbers too wide for the gutter keep their last lw digits.
+    return f"{line_num:>{lw}}"[-lw:]
+
+
+def _ensure_num_cache(count, lw):
+    """Return the label list for width lw, holding up to count entries.
+
+    The list never grows past _NUM_CACHE_MAX, so callers must format rows
+    beyond its end themselves.
+    """
+    labels = _num_cache.get(lw)
+    if labels is None:
+        labels = _num_cache[lw] = []
+    for line_num in range(len(labels) + 1, min(count, _NUM_CACHE_MAX) + 1):
+        labels.append(_format_num(line_num, lw))
+    return labels
+
 
 def _on_layout(event, payload):
     """Ask the editor to reserve space on the left for line numbers."""
@@ -23,22 +70,24 @@ def _on_render_overlay(event, payload):
 
     ly, lx, lh, lw = left
     scroll_y = api.get_scroll_y()
-    num_lines = len(api.get_lines())
-    cursor_row = api.get_cursor()[0]
+    num_lines = len(_get_lines(payload))
+    cursor_row = _get_cursor(payload)[0]
 
     # Use a dim style for the gutter; highlight the current line's number if desired
     attr_dim = api.get_data("theme.ui", curses.A_DIM)
     attr_current = api.get_data("theme.ui_active", curses.A_REVERSE)
     win = api.get_win()
 
+    if lw <= 0:
+        return
+    labels = _ensure_num_cache(min(scroll_y + lh, num_lines), lw)
+    cached = len(labels)
+
     for row in range(lh):
         line_idx = scroll_y + row
         if line_idx >= num_lines:
             break
-        line_num = line_idx + 1
-        text = str(line_num).rjust(lw)  # right-align: spaces on left for short numbers; 12345 fills all 5
-        if len(text) > lw:
-            text = text[-lw:]
+        text = labels[line_idx] if line_idx < cached else _format_num(line_idx + 1, lw)
         use_attr = attr_current if line_idx == cursor_row else attr_dim
         try:
             win.addnstr(ly + row, lx, text, max(0, lw), use_attr)
@@ -22,28 +22,39 @@ def _prompt_filename(api):
     if w <= len(PROMPT_PREFIX) + 1:
         return None
 
-    name = ""
+    # Typed bytes (printable ASCII only) and how many of them fit after the prefix
+    name = bytearray()
+    visible_len = w - 1 - len(PROMPT_PREFIX)
+
+    redraw = True
 
     while True:
-        line = PROMPT_PREFIX + name
-        visible = line[-(w - 1) :] if len(line) > w - 1 else line
-        try:
-            win.move(y, x)
-            win.clrtoeol()
-            win.addnstr(y, x, visible, w - 1)
-            win.refresh()
-        except curses.error:
-            pass
+        if redraw:
+            redraw = False
+            try:
+                win.move(y, x)
+                win.clrtoeol()
+                win.addnstr(y, x, PROMPT_PREFIX, len(PROMPT_PREFIX))
+                # Only the tail of a long name is shown
+                tail = name[-visible_len:].decode("ascii")
+                win.addnstr(y, x + len(PROMPT_PREFIX), tail, visible_len)
+                win.noutrefresh()
+                curses.doupdate()
+            except curses.error:
+                pass
 
         key = win.getch()
         if key in (curses.KEY_ENTER, 10, 13):
-            return name.strip() or None
+            return name.decode("ascii").strip() or None
         if key == 27:  # Escape
             return None
         if key in (curses.KEY_BACKSPACE, 127):
-            name = name[:-1]
+            if name:
+                del name[-1]
+                redraw = True
         elif 32 <= key <= 126 and len(name) < MAX_PATH_LEN:
-            name += chr(key)
+            name.append(key)
+            redraw = True
 
 
 def _on_before_save(event, payload):
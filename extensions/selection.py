@@ -2,6 +2,9 @@
 
 Selection is defined by an anchor point and the current cursor position.
 Any non-shift key clears the selection.
+
+The anchor lives only in the shared data store as selection.anchor, so
+changes made by other extensions (e.g. selection_delete) are seen here too.
 """
 
 import curses
@@ -12,40 +15,51 @@ KEY_SRIGHT = 402
 KEY_SUP = 337
 KEY_SDOWN = 336
 
-_SHIFT_KEYS = {KEY_SLEFT, KEY_SRIGHT, KEY_SUP, KEY_SDOWN}
+# Non-shift keys cost one selection.anchor lookup (the anchor is shared, so it
+# is re-read on every key) plus this frozenset test. Keys may also be strings
+# dispatched by extended_keys (e.g. "ctrl_z"), so numeric range checks won't do.
+_SHIFT_KEYS = frozenset({KEY_SLEFT, KEY_SRIGHT, KEY_SUP, KEY_SDOWN})
 
-# Module-level selection state
-_anchor: tuple[int, int] | None = None
 
+def _get_lines(payload):
+    """Return the buffer lines, fetched at most once per event dispatch.
+
+    The list is cached on the payload so later hooks for the same event can
+    reuse it. Treat it as read-only.
+    """
+    lines = payload.get("lines")
+    if lines is None:
+        lines = payload["lines"] = payload["api"].get_lines()
+    return lines
 
-def _get_sorted_range(anchor: tuple[int, int], cursor: tuple[int, int]):
-    """Return (start_row, start_col, end_row, end_col) with start <= end."""
-    if anchor <= cursor:
-        return anchor[0], anchor[1], cursor[0], cursor[1]
-    return cursor[0], cursor[1], anchor[0], anchor[1]
+
+def _get_cursor(payload):
+    """Return the cursor (row, col), fetched at most once per event dispatch."""
+    cursor = payload.get("cursor")
+    if cursor is None:
+        cursor = payload["cursor"] = payload["api"].get_cursor()
+    return cursor
 
 
 def _on_key(event, payload):
     """Handle shift+arrow keys for selection; clear on anything else."""
-    global _anchor
     api = payload["api"]
     key = payload.get("key")
+    anchor = api.get_data("selection.anchor")
 
     if key not in _SHIFT_KEYS:
         # Any non-shift key clears the selection
-        if _anchor is not None:
-            _anchor = None
+        if anchor is not None:
             api.set_data("selection.anchor", None)
         return False  # Let core handle
 
     # Start selection at current cursor if not already active
-    if _anchor is None:
-        _anchor = api.get_cursor()
-        api.set_data("selection.anchor", _anchor)
+    row, col = _get_cursor(payload)
+    if anchor is None:
+        api.set_data("selection.anchor", (row, col))
 
     # Move the cursor (mirrors core arrow-key logic)
-    row, col = api.get_cursor()
-    lines = api.get_lines()
+    lines = _get_lines(payload)
 
     if key == KEY_SLEFT:
         if col > 0:
@@ -60,18 +74,20 @@ def _on_key(event, payload):
         if row < len(lines) - 1:
             api.set_cursor(row + 1, col)
 
+    payload.pop("cursor", None)  # The cursor may have moved
     return True  # Consume the key so core doesn't also move
 
 
 def _on_render_overlay(event, payload):
-    """Overdraw selected characters with highlight attribute."""
-    if _anchor is None:
+    """Highlight the selected characters with A_REVERSE."""
+    api = payload["api"]
+    anchor = api.get_data("selection.anchor")
+    if anchor is None:
         return
 
-    api = payload["api"]
-    cursor = api.get_cursor()
+    cursor = _get_cursor(payload)
 
-    if _anchor == cursor:
+    if anchor == cursor:
         return  # Nothing to highlight
 
     rect = api.get_content_rect()
@@ -81,18 +97,25 @@ def _on_render_overlay(event, payload):
     cy, cx, ch, cw = rect
     scroll_y = api.get_scroll_y()
     scroll_x = api.get_scroll_x()
-    win = api.get_win()
-    lines = api.get_lines()
 
-    sr, sc, er, ec = _get_sorted_range(_anchor, cursor)
+    # Order the endpoints so (sr, sc) comes first
+    if anchor <= cursor:
+        (sr, sc), (er, ec) = anchor, cursor
+    else:
+        (sr, sc), (er, ec) = cursor, anchor
 
-    for screen_row in range(ch):
-        line_idx = scroll_y + screen_row
-        if line_idx < sr or line_idx > er:
-            continue
-        if line_idx >= len(lines):
-            break
+    # Only visit the rows where the selection and the viewport overlap
+    top = max(sr, scroll_y)
+    bottom = min(er, scroll_y + ch - 1)
+    if top > bottom:
+        return  # Selection is scrolled out of view
+
+    win = api.get_win()
+    lines = _get_lines(payload)
+    bottom = min(bottom, len(lines) - 1)
 
+    for line_idx in range(top, bottom + 1):
+        screen_row = line_idx - scroll_y
         line = lines[line_idx]
 
         # Determine selection columns for this line
@@ -113,11 +136,11 @@ def _on_render_overlay(event, payload):
         if vis_start >= vis_end:
             continue
 
-        text = line[vis_start:vis_end]
         screen_x = cx + (vis_start - scroll_x)
 
+        # The text is already on screen; only change its attributes
         try:
-            win.addnstr(cy + screen_row, screen_x, text, vis_end - vis_start, curses.A_REVERSE)
+            win.chgat(cy + screen_row, screen_x, vis_end - vis_start, curses.A_REVERSE)
         except curses.error:
             pass
 
@@ -8,38 +8,53 @@ is removed and the cursor moves to where the selection started.
 import curses
 
 # Backspace can be different key codes depending on the terminal
-BACKSPACE_KEYS = {curses.KEY_BACKSPACE, 127, 8}
+BACKSPACE_KEYS = frozenset({curses.KEY_BACKSPACE, 127, 8})
 
 
-def _get_sorted_range(anchor, cursor):
-    """Return (start_row, start_col, end_row, end_col) with start <= end."""
-    if anchor <= cursor:
-        return anchor[0], anchor[1], cursor[0], cursor[1]
-    return cursor[0], cursor[1], anchor[0], anchor[1]
+def _get_lines(payload):
+    """Return the buffer lines, fetched at most once per event dispatch.
+
+    The list is cached on the payload so later hooks for the same event can
+    reuse it. Treat it as read-only.
+    """
+    lines = payload.get("lines")
+    if lines is None:
+        lines = payload["lines"] = payload["api"].get_lines()
+    return lines
+
+
+def _get_cursor(payload):
+    """Return the cursor (row, col), fetched at most once per event dispatch."""
+    cursor = payload.get("cursor")
+    if cursor is None:
+        cursor = payload["cursor"] = payload["api"].get_cursor()
+    return cursor
 
 
 def _on_key(event, payload):
     """If Backspace is pressed while text is selected, delete the selection."""
-    api = payload["api"]
-    key = payload.get("key")
-
     # Only handle Backspace
-    if key not in BACKSPACE_KEYS:
+    if payload.get("key") not in BACKSPACE_KEYS:
         return False
 
+    api = payload["api"]
+
     # Check if there is an active selection
     anchor = api.get_data("selection.anchor")
     if anchor is None:
         return False
 
-    cursor = api.get_cursor()
+    cursor = _get_cursor(payload)
     if anchor == cursor:
         return False
 
     # Figure out which part of the selection comes first
-    sr, sc, er, ec = _get_sorted_range(anchor, cursor)
+    if anchor <= cursor:
+        (sr, sc), (er, ec) = anchor, cursor
+    else:
+        (sr, sc), (er, ec) = cursor, anchor
 
-    lines = api.get_lines()
+    lines = _get_lines(payload)
 
     # Build new lines: everything before the selection + everything after
     text_before_selection = lines[sr][:sc]
@@ -50,6 +65,8 @@ def _on_key(event, payload):
 
     api.replace_lines(new_lines)
     api.set_cursor(sr, sc)
+    payload.pop("lines", None)
+    payload.pop("cursor", None)
 
     # Clear the selection
     api.set_data("selection.anchor", None)
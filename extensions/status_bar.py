@@ -2,23 +2,37 @@
 
 import curses
 
+# Status line from the last render, reused until its inputs change
+_last_key = None
+_last_line = ""
+
+
+def _get_cursor(payload):
+    """Return the cursor (row, col), fetched at most once per event dispatch."""
+    cursor = payload.get("cursor")
+    if cursor is None:
+        cursor = payload["cursor"] = payload["api"].get_cursor()
+    return cursor
+
 
 def _on_layout(event, payload):
     payload["api"].request_footer_rows(1)
 
 
-def _on_render_overlay(event, payload):
-    api = payload["api"]
-    win = api.get_win()
-
-    # Build the status text
-    path = api.get_path()
-    row, col = api.get_cursor()
+def _build_line(path, dirty, row, col, msg, w):
+    """Return the status text, trimmed to w - 1 columns."""
     filename = path.name if path else "[Untitled]"
-    dirty_mark = "*" if api.is_dirty() else "-"
+    dirty_mark = "*" if dirty else "-"
     left = f" {filename} {dirty_mark} | Ln {row + 1}, Col {col + 1} "
-    msg = api.get_message().strip()
+    msg = msg.strip()
     text = f"{left}| {msg}" if msg else left
+    return text[:w - 1]
+
+
+def _on_render_overlay(event, payload):
+    global _last_key, _last_line
+    api = payload["api"]
+    win = api.get_win()
 
     # Determine where to draw: use footer rect if available, else last row
     footer = api.get_footer_rect()
@@ -28,11 +42,25 @@ def _on_render_overlay(event, payload):
     else:
         height, width = api.get_size()
         y, x, w = height - 1, 0, width
+    if w <= 1:
+        return
+
+    # Rebuild the status text only when something it shows has changed
+    row, col = _get_cursor(payload)
+    key = (api.get_path(), api.is_dirty(), row, col, api.get_message(), w)
+    if key != _last_key:
+        _last_key = key
+        _last_line = _build_line(*key)
+    line = _last_line
 
+    # Clear the old text, draw the new, then extend the bar style over the
+    # rest of the row instead of padding the string with spaces
     attr = api.get_data("theme.ui_active", curses.A_REVERSE)
-    line = text[:w - 1].ljust(w - 1) if w > 0 else ""
     try:
-        win.addnstr(y, x, line, max(0, w - 1), attr)
+        win.move(y, x)
+        win.clrtoeol()
+        win.addnstr(y, x, line, w - 1, attr)
+        win.chgat(y, x, w - 1, attr)
     except Exception:
         pass
 
@@ -140,6 +140,18 @@ _cached_tokens: list[list[tuple]] | None = None
 _DEFAULT_ATTR = curses.A_NORMAL
 
 
+def _get_lines(payload):
+    """Return the buffer lines, fetched at most once per event dispatch.
+
+    The list is cached on the payload so later hooks for the same event can
+    reuse it. Treat it as read-only.
+    """
+    lines = payload.get("lines")
+    if lines is None:
+        lines = payload["lines"] = payload["api"].get_lines()
+    return lines
+
+
 def _on_render_overlay(event, payload):
     global _cached_path, _cached_lang, _cached_lines, _cached_tokens
 
@@ -160,7 +172,7 @@ def _on_render_overlay(event, payload):
         return
 
     # Re-tokenize only when buffer content changes
-    lines = api.get_lines()
+    lines = _get_lines(payload)
     if lines != _cached_lines:
         _cached_lines = lines
         _cached_tokens = _tokenize_buffer(lines, _cached_lang)
@@ -11,33 +11,103 @@ KEY_PREV_TAB = 11  # Ctrl+K
 KEY_NEXT_TAB = 12  # Ctrl+L
 KEY_NEW_TAB = 14  # Ctrl+N
 
+# Every key this extension handles; anything else returns immediately
+_KEYS = frozenset({KEY_PREV_TAB, KEY_NEXT_TAB, KEY_NEW_TAB})
+_SWITCH_KEYS = frozenset({KEY_PREV_TAB, KEY_NEXT_TAB})
+
 tabs = []
 current_tab = 0
 
+# Net Ctrl+K/L movement not applied yet. Flushed before the next render and
+# before any other key, so auto-repeat restores only the tab it lands on.
+_pending_delta = 0
+
+# Set when a key has been handled since the last frame. Every buffer edit,
+# load or path change arrives through a key, so when this is False the
+# active tab's path and dirty flag can't have changed.
+_buffer_touched = True
+
+# Tab bar styles, read from the theme once at startup
+_ui_attr = 0
+_ui_active_attr = curses.A_REVERSE
+
+# Tab bar layout from the last render, reused until the signature changes.
+# Segments are (x, text, width, tab_index). _bar_version is bumped whenever a
+# tab is added or a tab's path/dirty flag changes, so the signature is O(1).
+_bar_version = 0
+_bar_signature = None
+_bar_segments = []
+
+
+def _display_name(path):
+    """Return the tab label for path: the filename, or "[Untitled]"."""
+    return path.name if path else "[Untitled]"
+
 
-def make_tab(path=None, lines=None, cursor=(0, 0), scroll_y=0, scroll_x=0, dirty=False):
+def _file_stamp(path):
+    """Return (mtime in ns, size) for path, or None if it has no readable file.
+
+    The size catches rewrites within one mtime tick on coarse filesystems.
+    """
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def make_tab(path=None, lines=None, cursor=(0, 0), scroll_y=0, scroll_x=0, dirty=False,
+             stamp=None):
     """Return a new tab dictionary with the given values (all optional)."""
     return {
         "path": path,
+        "name": _display_name(path),
         "lines": lines if lines is not None else [""],
         "cursor": cursor,
         "scroll_y": scroll_y,
         "scroll_x": scroll_x,
         "dirty": dirty,
+        # True while "lines" is known to match the editor buffer; cleared on
+        # edits, saves and file loads so the next switch takes a new snapshot
+        "synced": False,
+        # _file_stamp() of the file "lines" was last loaded from or saved to;
+        # None if unknown
+        "stamp": stamp,
     }
 
 
+def _set_tab_state(tab, path, dirty):
+    """Set a tab's path and dirty flag; invalidate the tab bar if either changed."""
+    global _bar_version
+    if tab["path"] != path:
+        tab["path"] = path
+        tab["name"] = _display_name(path)
+        tab["stamp"] = _file_stamp(path)
+        _bar_version += 1
+    if tab["dirty"] != dirty:
+        tab["dirty"] = dirty
+        _bar_version += 1
+
+
 def save_current_tab(api):
     """Snapshot the editor's current state into the active tab slot."""
     if current_tab >= len(tabs):
         return
     tab = tabs[current_tab]
-    tab["path"] = api.get_path()
-    tab["lines"] = api.get_lines()
+    path = api.get_path()
+    dirty = api.is_dirty()
+    # Copying the whole buffer is only needed if it may differ from the
+    # tab's last snapshot
+    if (dirty or dirty != tab["dirty"] or not tab["synced"]
+            or path != tab["path"]):
+        tab["lines"] = api.get_lines()
+        tab["synced"] = True
+    _set_tab_state(tab, path, dirty)
     tab["cursor"] = api.get_cursor()
     tab["scroll_y"] = api.get_scroll_y()
     tab["scroll_x"] = api.get_scroll_x()
-    tab["dirty"] = api.is_dirty()
 
 
 def switch_to_tab(api, index):
@@ -47,58 +117,104 @@ def switch_to_tab(api, index):
         return
     current_tab = index
     tab = tabs[index]
-    if tab["path"] is not None and not tab["dirty"] and tab["path"].exists():
+    # A clean tab is only reloaded from disk if the file changed since its
+    # snapshot was taken; otherwise the snapshot is restored from memory
+    stamp = _file_stamp(tab["path"]) if not tab["dirty"] else None
+    if stamp is not None and stamp != tab["stamp"]:
         api.load_file(tab["path"])
+        tab["stamp"] = stamp
+        tab["synced"] = False  # The file on disk may differ from the snapshot
     else:
+        # The editor takes the stored list as its buffer; no copy is made
         api.replace_lines(tab["lines"], dirty=tab["dirty"])
         api.set_path(tab["path"])
+        # A restored dirty buffer can go clean without a save (e.g. the file
+        # is reopened), leaving the snapshot stale, so only clean ones count
+        tab["synced"] = not tab["dirty"]
     api.set_cursor(tab["cursor"][0], tab["cursor"][1])
     api.set_scroll_y(tab["scroll_y"])
     api.set_scroll_x(tab["scroll_x"])
 
+
+def _flush_tab_switch(api):
+    """Apply any pending Ctrl+K/L movement as a single tab switch."""
+    global _pending_delta
+    delta = _pending_delta
+    if not delta:
+        return
+    _pending_delta = 0
+    index = (current_tab + delta) % len(tabs)
+    if index == current_tab:
+        return  # Only one tab, or the repeats cancelled out
+    save_current_tab(api)
+    switch_to_tab(api, index)
+
+
 def _on_init(event, payload):
     """Called once at startup. Turn the initial buffer into the first tab."""
-    global tabs, current_tab
+    global tabs, current_tab, _bar_version
     api = payload["api"]
-    tabs = [make_tab(
-        path = api.get_path(),
-        lines = api.get_lines(),
+    path = api.get_path()
+    tab = make_tab(
+        path = path,
         cursor = api.get_cursor(),
         scroll_y = api.get_scroll_y(),
         scroll_x = api.get_scroll_x(),
         dirty = api.is_dirty(),
-    )]
+        stamp = _file_stamp(path),
+    )
+    # The buffer is live in the editor, so don't copy it yet. The tab is not
+    # synced, so save_current_tab snapshots it before it is first switched away.
+    tab["lines"] = None
+    tabs = [tab]
     current_tab = 0
+    _bar_version += 1
     api.set_data("tabs.list", tabs)
 
 
+def _on_init_theme(event, payload):
+    """Cache the tab bar styles. Runs after the theme extension's init hook."""
+    global _ui_attr, _ui_active_attr
+    api = payload["api"]
+    _ui_attr = api.get_data("theme.ui", 0)
+    _ui_active_attr = api.get_data("theme.ui_active", curses.A_REVERSE)
+
+
 def _on_layout(event, payload):
     """Reserve one row at the top of the screen for the tab bar."""
     payload["api"].request_header_rows(1)
 
 
-def _on_render_overlay(event, payload):
-    """Draw the tab bar across the top of the screen."""
-    api = payload["api"]
+def _on_before_render(event, payload):
+    """Keep the active tab's path and dirty flag in sync with the buffer.
 
-    # Keep the active tab in sync with the buffer
+    Runs once per frame before drawing, so the overlay only has to draw and
+    confirm_quit sees up-to-date dirty flags in tabs.list.
+    """
+    global _buffer_touched
+    api = payload["api"]
+    _flush_tab_switch(api)
+    if not _buffer_touched:
+        return
+    _buffer_touched = False
     if 0 <= current_tab < len(tabs):
-        tabs[current_tab]["path"] = api.get_path()
-        tabs[current_tab]["dirty"] = api.is_dirty()
+        tab = tabs[current_tab]
+        path = api.get_path()
+        dirty = api.is_dirty()
+        if dirty or dirty != tab["dirty"] or path != tab["path"]:
+            tab["synced"] = False
+        _set_tab_state(tab, path, dirty)
 
-    header = api.get_header_rect()
-    if not header:
-        return
 
-    win = api.get_win()
-    hy, hx, hh, hw = header  # row, column, height, width of the header area
+def _layout_tab_bar(hx, hw):
+    """Return the (x, text, width, tab_index) segments that fit in the header."""
+    segments = []
     x = hx
     remaining = hw
 
     for i, tab in enumerate(tabs):
         # Build the label: filename (or "[Untitled]") with "*" when unsaved
-        name = tab["path"].name if tab["path"] else "[Untitled]"
-        label = name + ("*" if tab["dirty"] else "")
+        label = tab["name"] + ("*" if tab["dirty"] else "")
 
         # Stop drawing if there is no space left
         if remaining <= 1:
@@ -107,61 +223,109 @@ def _on_render_overlay(event, payload):
         # How many columns does this tab segment get
         seg_len = min(max(4, len(label) + 3), remaining)
 
-        # Pad/trim the text to fit exactly in seg_len columns
-        text = (" " + label)[:seg_len - 1].ljust(seg_len - 1)
+        # Pad/trim the text to fit exactly in seg_len - 1 columns (one leading
+        # space, then the label), built in a single format call
+        width = seg_len - 1
+        text = f" {label:<{width - 1}.{width - 1}}" if width > 1 else " "
+        segments.append((x, text, width, i))
+
+        x += seg_len
+        remaining -= seg_len
+
+    return segments
+
+
+def _on_render_overlay(event, payload):
+    """Draw the tab bar across the top of the screen."""
+    global _bar_signature, _bar_segments
+    api = payload["api"]
+    header = api.get_header_rect()
+    if not header:
+        return
+
+    hy, hx, hh, hw = header  # row, column, height, width of the header area
 
+    # Only re-layout when a label or the header size changed. The bar is
+    # still drawn every frame, since the core may have repainted the window.
+    signature = (_bar_version, hx, hw)
+    if signature != _bar_signature:
+        _bar_signature = signature
+        _bar_segments = _layout_tab_bar(hx, hw)
+
+    # Loop invariants bound to locals once per frame
+    addnstr = api.get_win().addnstr
+    active = current_tab
+    attrs = (_ui_attr, _ui_active_attr)  # Indexed by "is the active tab"
+    for x, text, width, i in _bar_segments:
         # Highlight the active tab; leave others in the normal style
-        if i == current_tab:
-            attr = api.get_data("theme.ui_active", curses.A_REVERSE)
-        else:
-            attr = api.get_data("theme.ui", 0)
+        attr = attrs[i == active]
 
         try:
-            win.addnstr(hy, x, text, seg_len - 1, attr)
+            addnstr(hy, x, text, width, attr)
         except Exception:
             pass
 
-        x += seg_len
-        remaining -= seg_len
+
+def _on_any_key(event, payload):
+    """Before any other key is handled, finish a pending tab switch."""
+    global _buffer_touched
+    _buffer_touched = True
+    if _pending_delta and payload.get("key") not in _SWITCH_KEYS:
+        _flush_tab_switch(payload["api"])
+    return False
 
 
 def _on_key(event, payload):
     """Handle Ctrl+K / Ctrl+L (switch tab) and Ctrl+N (new tab)."""
+    global _bar_version, _pending_delta
     key = payload.get("key")
+    if key not in _KEYS:
+        return False
+
     api = payload["api"]
 
     if key == KEY_PREV_TAB:
-        save_current_tab(api)
-        switch_to_tab(api, (current_tab - 1) % len(tabs))
+        _pending_delta -= 1
         return True
 
     if key == KEY_NEXT_TAB:
-        save_current_tab(api)
-        switch_to_tab(api, (current_tab + 1) % len(tabs))
+        _pending_delta += 1
         return True
 
     if key == KEY_NEW_TAB:
         save_current_tab(api)
         tabs.append(make_tab())
+        _bar_version += 1
         switch_to_tab(api, len(tabs) - 1)
         return True
 
 
 def _on_saved(event, payload):
     """Mark the active tab as clean after a successful save."""
+    global _buffer_touched
+    _buffer_touched = True  # Saving may also have given the buffer a path
     if 0 <= current_tab < len(tabs):
-        tabs[current_tab]["dirty"] = False
+        tab = tabs[current_tab]
+        tab["synced"] = False
+        tab["stamp"] = _file_stamp(tab["path"])
+        _set_tab_state(tab, tab["path"], False)
 
 
 def _on_before_quit(event, payload):
     """Snapshot current tab so its dirty state is up to date."""
-    save_current_tab(payload["api"])
+    api = payload["api"]
+    _flush_tab_switch(api)
+    save_current_tab(api)
 
 
 def setup(register_hook):
     register_hook(0, _on_init, event="init")
+    register_hook(1, _on_init_theme, event="init")
     register_hook(10, _on_layout, event="layout")
+    # Runs ahead of every other key hook so none of them sees the old tab
+    register_hook(-1, _on_any_key, event="key")
     register_hook(5, _on_key, event="key")
+    register_hook(10, _on_before_render, event="before_render")
     register_hook(30, _on_render_overlay, event="render_overlay")
     register_hook(0, _on_saved, event="saved")
     register_hook(0, _on_before_quit, event="before_quit")
@@ -13,6 +13,9 @@ MAX_HISTORY = 100  # cap when pushing current onto history on redo
 KEY_CTRL_Z = 26  # Ctrl+Z
 KEY_CTRL_SHIFT_Z = "ctrl_shift_z"  # Ctrl+Shift+Z
 
+# Every key this extension handles; anything else returns immediately
+_KEYS = frozenset({KEY_CTRL_Z, KEY_CTRL_SHIFT_Z})
+
 
 def _restore_state(api, state):
     """Replace the buffer with `state` and move the cursor."""
@@ -25,8 +28,11 @@ def _restore_state(api, state):
 
 def _on_key(event, payload):
     """Handle Ctrl+Z (undo) and Ctrl+Shift+Z (redo) key events."""
-    api = payload["api"]
     key = payload["key"]
+    if key not in _KEYS:
+        return False
+
+    api = payload["api"]
 
     if key == KEY_CTRL_Z:
         states = list(api.get_data("history.states", []))